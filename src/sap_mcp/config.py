@@ -1,12 +1,23 @@
 """Configuration loader for SAP MCP Server."""
 
+import copy
+import functools
+import json
+import pickle
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
+import jsonschema
 import yaml
 
+try:
+    # libyaml-backed loader is ~10x faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ServerConfig:
     """Server configuration."""
     name: str
@@ -15,7 +26,7 @@ class ServerConfig:
     http_port: int = 8088  # Default HTTP port for SSE transport
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HanaConnectorConfig:
     """SAP HANA connection configuration."""
     type: str = "hana"
@@ -28,7 +39,7 @@ class HanaConnectorConfig:
     sslValidateCertificate: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OdbcConnectorConfig:
     """ODBC connection configuration."""
     type: str = "odbc"
@@ -47,8 +58,9 @@ class Config:
     def connector_type(self) -> str:
         return self.connector.get("type", "hana")
 
-    def get_hana_config(self) -> HanaConnectorConfig:
-        """Get HANA connector configuration."""
+    @functools.cached_property
+    def hana_config(self) -> HanaConnectorConfig:
+        """HANA connector configuration, built once per Config."""
         return HanaConnectorConfig(
             type="hana",
             host=self.connector.get("host", ""),
@@ -60,22 +72,97 @@ class Config:
             sslValidateCertificate=self.connector.get("sslValidateCertificate", True),
         )
 
-    def get_odbc_config(self) -> OdbcConnectorConfig:
-        """Get ODBC connector configuration."""
+    @functools.cached_property
+    def odbc_config(self) -> OdbcConnectorConfig:
+        """ODBC connector configuration, built once per Config."""
         return OdbcConnectorConfig(
             type="odbc",
             connection_string=self.connector.get("connection_string", ""),
         )
 
+    def get_hana_config(self) -> HanaConnectorConfig:
+        """Get HANA connector configuration."""
+        return self.hana_config
+
+    def get_odbc_config(self) -> OdbcConnectorConfig:
+        """Get ODBC connector configuration."""
+        return self.odbc_config
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML file, cached on (path, mtime, size).
+
+    The mtime/size arguments only serve as cache keys: a rewritten file
+    gets a new key, so stale entries evict themselves naturally.
+
+    JSON is a subset of YAML, and parsing it with json.loads is around
+    two orders of magnitude faster, so a file that looks like a JSON
+    document is probed with the JSON parser before falling back to YAML.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    if text.lstrip()[:1] == "{":
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+
+    return yaml.load(text, Loader=_YamlLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_json(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a JSON file, cached on (path, mtime, size)."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def json_cache_path(config_path: str) -> Path:
+    """Path of the JSON sidecar cache for a YAML config file."""
+    return Path(config_path).with_suffix(".cache.json")
+
 
 def load_config(config_path: str) -> Config:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file.
+
+    If a JSON sidecar cache (written by the config wizard) exists and is
+    at least as new as the YAML file, it is parsed instead -- JSON
+    parsing is roughly two orders of magnitude faster than YAML.
+
+    On top of that, the fully built Config is pickled to a sibling
+    .pkl file after the first parse; while the pickle is at least as
+    new as the YAML, later loads skip parsing and construction entirely.
+    """
     path = Path(config_path)
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    st = path.stat()
+
+    pkl = path.with_suffix(path.suffix + ".pkl")
+    try:
+        if pkl.stat().st_mtime_ns >= st.st_mtime_ns:
+            return pickle.loads(pkl.read_bytes())
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        pass
+
+    data = None
+
+    cache = json_cache_path(config_path)
+    try:
+        cache_st = cache.stat()
+        if cache_st.st_mtime_ns >= st.st_mtime_ns:
+            data = _parse_json(str(cache), cache_st.st_mtime_ns, cache_st.st_size)
+    except (OSError, ValueError):
+        data = None
+
+    if data is None:
+        data = _parse_yaml(str(path), st.st_mtime_ns, st.st_size)
+
+    # Deep-copy so callers can't mutate the cached parse result
+    data = copy.deepcopy(data)
 
     # Validate required fields
     if "server" not in data:
@@ -96,38 +183,88 @@ def load_config(config_path: str) -> Config:
         http_port=server_data.get("http_port", 8088),
     )
 
-    return Config(
+    config = Config(
         server=server,
         connector=data["connector"],
         tables=data.get("tables", []),
         log_file=data.get("log_file"),
     )
 
+    # Best effort: a read-only config directory just means no cache
+    try:
+        pkl.write_bytes(pickle.dumps(config, protocol=5))
+    except OSError:
+        pass
+
+    return config
+
+
+# Validation schemas, compiled once at import so validate_config is a
+# single traversal instead of a ladder of per-field checks.
+_SERVER_SCHEMA = {
+    "type": "object",
+    "required": ["name", "prefix"],
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "prefix": {"type": "string", "minLength": 1},
+        "version": {"type": "string"},
+        "http_port": {"type": "integer", "minimum": 1, "maximum": 65535},
+    },
+}
+
+_CONNECTOR_SCHEMAS = {
+    "hana": {
+        "type": "object",
+        "required": ["host", "user", "password"],
+        "properties": {
+            "host": {"type": "string", "minLength": 1},
+            "port": {"type": "integer", "minimum": 1, "maximum": 65535},
+            "user": {"type": "string", "minLength": 1},
+            "password": {"type": "string", "minLength": 1},
+        },
+    },
+    "odbc": {
+        "type": "object",
+        "required": ["connection_string"],
+        "properties": {
+            "connection_string": {"type": "string", "minLength": 1},
+        },
+    },
+}
+
+_SERVER_VALIDATOR = jsonschema.Draft202012Validator(_SERVER_SCHEMA)
+_CONNECTOR_VALIDATORS = {
+    name: jsonschema.Draft202012Validator(schema)
+    for name, schema in _CONNECTOR_SCHEMAS.items()
+}
+
+
+def _format_error(error: jsonschema.ValidationError, section: str) -> str:
+    """Format a schema validation error with its config location."""
+    location = ".".join([section, *map(str, error.absolute_path)])
+    return f"{location}: {error.message}"
+
 
 def validate_config(config: Config) -> list[str]:
     """Validate configuration and return list of errors."""
-    errors = []
-
-    if not config.server.name:
-        errors.append("Server name is required")
-    if not config.server.prefix:
-        errors.append("Server prefix is required")
+    server = {
+        "name": config.server.name,
+        "prefix": config.server.prefix,
+        "version": config.server.version,
+        "http_port": config.server.http_port,
+    }
+    errors = [
+        _format_error(e, "server") for e in _SERVER_VALIDATOR.iter_errors(server)
+    ]
 
     connector_type = config.connector_type
-
-    if connector_type == "hana":
-        hana = config.get_hana_config()
-        if not hana.host:
-            errors.append("HANA host is required")
-        if not hana.user:
-            errors.append("HANA user is required")
-        if not hana.password:
-            errors.append("HANA password is required")
-    elif connector_type == "odbc":
-        odbc = config.get_odbc_config()
-        if not odbc.connection_string:
-            errors.append("ODBC connection_string is required")
-    else:
+    validator = _CONNECTOR_VALIDATORS.get(connector_type)
+    if validator is None:
         errors.append(f"Unknown connector type: {connector_type}")
+    else:
+        errors.extend(
+            _format_error(e, "connector")
+            for e in validator.iter_errors(config.connector)
+        )
 
     return errors
@@ -1,8 +1,9 @@
 """SAP MCP Server - Configuration Wizard with Connection Testing."""
 
+import concurrent.futures
+import json
 import os
 import sys
-import threading
 
 # Hide console window on Windows when running as frozen exe
 if sys.platform == "win32":
@@ -18,6 +19,18 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import yaml
 
+try:
+    # libyaml-backed dumper, falls back to the pure-Python one
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+try:
+    # Import once at module load instead of on every connection test
+    from hdbcli import dbapi as _dbapi
+except ImportError:
+    _dbapi = None
+
 
 class ConfigWizard:
     """GUI wizard for configuring SAP MCP Server with connection testing."""
@@ -44,6 +57,10 @@ class ConfigWizard:
         self.prefix_var = tk.StringVar(value="sap_hana")
         self.http_port_var = tk.StringVar(value="8088")
 
+        # Single worker for connection tests; results are polled from
+        # the Tk event loop, so no other thread ever touches Tk
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
         self.create_widgets()
 
     def create_widgets(self):
@@ -79,9 +96,41 @@ class ConfigWizard:
         db_entry.grid(row=3, column=1, pady=5, padx=(10, 0))
         ttk.Label(conn_frame, text="(Tenant DB for multi-tenant)", font=("Segoe UI", 8)).grid(row=4, column=1, sticky=tk.W, padx=(10, 0))
 
+        # Credentials and server-settings frames are built after the
+        # first paint (see _create_deferred_frames) so the window shows
+        # up without waiting for all 20+ widgets
+        self.main_frame = main_frame
+        self.root.after_idle(self._create_deferred_frames)
+
+        # Status label
+        self.status_var = tk.StringVar(value="")
+        self.status_label = ttk.Label(main_frame, textvariable=self.status_var, foreground="gray")
+        self.status_label.pack(pady=5)
+
+        # Buttons frame
+        btn_frame = ttk.Frame(main_frame)
+        btn_frame.pack(fill=tk.X, pady=(10, 0))
+
+        # Test button
+        self.test_btn = ttk.Button(btn_frame, text="Test Connection", command=self.test_connection)
+        self.test_btn.pack(side=tk.LEFT)
+
+        # Save button
+        self.save_btn = ttk.Button(btn_frame, text="Save Configuration", command=self.save_config)
+        self.save_btn.pack(side=tk.RIGHT)
+
+        # Cancel button
+        ttk.Button(btn_frame, text="Cancel", command=self.root.quit).pack(side=tk.RIGHT, padx=(0, 10))
+
+    def _create_deferred_frames(self):
+        """Create the credentials and server-settings frames.
+
+        Runs via after_idle once the window is on screen; the frames
+        pack before the status label to keep the original layout order.
+        """
         # Credentials frame
-        cred_frame = ttk.LabelFrame(main_frame, text="Credentials", padding="10")
-        cred_frame.pack(fill=tk.X, pady=(0, 10))
+        cred_frame = ttk.LabelFrame(self.main_frame, text="Credentials", padding="10")
+        cred_frame.pack(fill=tk.X, pady=(0, 10), before=self.status_label)
 
         # Username
         ttk.Label(cred_frame, text="Username:").grid(row=0, column=0, sticky=tk.W, pady=5)
@@ -92,8 +141,8 @@ class ConfigWizard:
         ttk.Entry(cred_frame, textvariable=self.password_var, width=40, show="*").grid(row=1, column=1, pady=5, padx=(10, 0))
 
         # Server settings frame
-        server_frame = ttk.LabelFrame(main_frame, text="MCP Server Settings", padding="10")
-        server_frame.pack(fill=tk.X, pady=(0, 10))
+        server_frame = ttk.LabelFrame(self.main_frame, text="MCP Server Settings", padding="10")
+        server_frame.pack(fill=tk.X, pady=(0, 10), before=self.status_label)
 
         # Server name
         ttk.Label(server_frame, text="Server Name:").grid(row=0, column=0, sticky=tk.W, pady=5)
@@ -108,47 +157,29 @@ class ConfigWizard:
         ttk.Entry(server_frame, textvariable=self.http_port_var, width=40).grid(row=2, column=1, pady=5, padx=(10, 0))
         ttk.Label(server_frame, text="(For remote access via ngrok)", font=("Segoe UI", 8)).grid(row=3, column=1, sticky=tk.W, padx=(10, 0))
 
-        # Status label
-        self.status_var = tk.StringVar(value="")
-        self.status_label = ttk.Label(main_frame, textvariable=self.status_var, foreground="gray")
-        self.status_label.pack(pady=5)
+    @staticmethod
+    def _check_nonempty(value):
+        return bool(value.strip())
 
-        # Buttons frame
-        btn_frame = ttk.Frame(main_frame)
-        btn_frame.pack(fill=tk.X, pady=(10, 0))
-
-        # Test button
-        self.test_btn = ttk.Button(btn_frame, text="Test Connection", command=self.test_connection)
-        self.test_btn.pack(side=tk.LEFT)
-
-        # Save button
-        self.save_btn = ttk.Button(btn_frame, text="Save Configuration", command=self.save_config)
-        self.save_btn.pack(side=tk.RIGHT)
-
-        # Cancel button
-        ttk.Button(btn_frame, text="Cancel", command=self.root.quit).pack(side=tk.RIGHT, padx=(0, 10))
-
-    def validate_inputs(self):
-        """Validate required inputs."""
-        if not self.host_var.get().strip():
-            messagebox.showerror("Validation Error", "Server hostname is required.")
-            return False
+    @staticmethod
+    def _check_port(value):
         try:
-            port = int(self.port_var.get())
-            if port < 1 or port > 65535:
-                raise ValueError()
+            return 1 <= int(value) <= 65535
         except ValueError:
-            messagebox.showerror("Validation Error", "Port must be a number between 1 and 65535.")
-            return False
-        if not self.user_var.get().strip():
-            messagebox.showerror("Validation Error", "Username is required.")
             return False
-        try:
-            http_port = int(self.http_port_var.get())
-            if http_port < 1 or http_port > 65535:
-                raise ValueError()
-        except ValueError:
-            messagebox.showerror("Validation Error", "HTTP port must be a number between 1 and 65535.")
+
+    def validate_inputs(self):
+        """Validate required inputs, showing all errors in one dialog."""
+        checks = [
+            (self.host_var, self._check_nonempty, "Server hostname is required."),
+            (self.port_var, self._check_port, "Port must be a number between 1 and 65535."),
+            (self.user_var, self._check_nonempty, "Username is required."),
+            (self.http_port_var, self._check_port, "HTTP port must be a number between 1 and 65535."),
+        ]
+
+        errors = [message for var, check, message in checks if not check(var.get())]
+        if errors:
+            messagebox.showerror("Validation Error", "\n".join(errors))
             return False
         return True
 
@@ -162,60 +193,71 @@ class ConfigWizard:
         self.save_btn.config(state=tk.DISABLED)
         self.status_var.set("Testing connection...")
         self.status_label.config(foreground="gray")
-        self.root.update()
 
-        # Run test in background thread
-        thread = threading.Thread(target=self._do_connection_test)
-        thread.start()
+        # Read the Tk variables on the main thread; the worker only
+        # sees plain values
+        connect_params = {
+            "address": self.host_var.get().strip(),
+            "port": int(self.port_var.get()),
+            "user": self.user_var.get().strip(),
+            "password": self.password_var.get(),
+            # Fail fast on a wrong host instead of hanging for the
+            # OS-default TCP timeout (values in milliseconds)
+            "connectTimeout": 5000,
+            "communicationTimeout": 10000,
+        }
+
+        # Add database name for multi-tenant
+        if self.database_var.get().strip():
+            connect_params["databaseName"] = self.database_var.get().strip()
+
+        future = self._executor.submit(self._blocking_test, connect_params)
+        self.root.after(50, self._poll_connection_test, future)
+
+    @staticmethod
+    def _blocking_test(connect_params):
+        """Run the connection test; returns (message, color).
+
+        Executes on the worker thread and must not touch Tk.
+        """
+        if _dbapi is None:
+            return ("Error: hdbcli module not installed.", "red")
+
+        # Attempt connection
+        conn = _dbapi.connect(**connect_params)
+
+        # Test with a simple query
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM DUMMY")
+        result = cursor.fetchone()
+        cursor.close()
+        conn.close()
+
+        if result and result[0] == 1:
+            return ("Connection successful!", "green")
+        return ("Connection succeeded but test query failed.", "orange")
+
+    def _poll_connection_test(self, future):
+        """Poll the connection-test future from the Tk event loop."""
+        if not future.done():
+            self.root.after(50, self._poll_connection_test, future)
+            return
 
-    def _do_connection_test(self):
-        """Perform the actual connection test."""
         try:
-            from hdbcli import dbapi
-
-            connect_params = {
-                "address": self.host_var.get().strip(),
-                "port": int(self.port_var.get()),
-                "user": self.user_var.get().strip(),
-                "password": self.password_var.get(),
-            }
-
-            # Add database name for multi-tenant
-            if self.database_var.get().strip():
-                connect_params["databaseName"] = self.database_var.get().strip()
-
-            # Attempt connection
-            conn = dbapi.connect(**connect_params)
-
-            # Test with a simple query
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1 FROM DUMMY")
-            result = cursor.fetchone()
-            cursor.close()
-            conn.close()
-
-            if result and result[0] == 1:
-                self._update_status("Connection successful!", "green")
-            else:
-                self._update_status("Connection succeeded but test query failed.", "orange")
-
-        except ImportError:
-            self._update_status("Error: hdbcli module not installed.", "red")
+            message, color = future.result()
         except Exception as e:
             error_msg = str(e)
             # Truncate long error messages
             if len(error_msg) > 100:
                 error_msg = error_msg[:100] + "..."
-            self._update_status(f"Connection failed: {error_msg}", "red")
-        finally:
-            # Re-enable buttons
-            self.root.after(0, lambda: self.test_btn.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.save_btn.config(state=tk.NORMAL))
+            message, color = f"Connection failed: {error_msg}", "red"
+
+        self.status_var.set(message)
+        self.status_label.config(foreground=color)
 
-    def _update_status(self, message, color):
-        """Update status label from background thread."""
-        self.root.after(0, lambda: self.status_var.set(message))
-        self.root.after(0, lambda: self.status_label.config(foreground=color))
+        # Re-enable buttons
+        self.test_btn.config(state=tk.NORMAL)
+        self.save_btn.config(state=tk.NORMAL)
 
     def get_config_path(self):
         """Get the configuration file path."""
@@ -233,32 +275,56 @@ class ConfigWizard:
         if not self.validate_inputs():
             return
 
+        # Read each Tk variable once; every .get() is a Tcl round-trip
+        vals = {
+            "host": self.host_var.get().strip(),
+            "port": int(self.port_var.get()),
+            "database": self.database_var.get().strip(),
+            "user": self.user_var.get().strip(),
+            "password": self.password_var.get(),
+            "server_name": self.server_name_var.get().strip(),
+            "prefix": self.prefix_var.get().strip(),
+            "http_port": int(self.http_port_var.get()),
+        }
+
         config = {
             "server": {
-                "name": self.server_name_var.get().strip(),
-                "prefix": self.prefix_var.get().strip(),
+                "name": vals["server_name"],
+                "prefix": vals["prefix"],
                 "version": "1.0",
-                "http_port": int(self.http_port_var.get())
+                "http_port": vals["http_port"]
             },
             "connector": {
                 "type": "hana",
-                "host": self.host_var.get().strip(),
-                "port": int(self.port_var.get()),
-                "user": self.user_var.get().strip(),
-                "password": self.password_var.get(),
+                "host": vals["host"],
+                "port": vals["port"],
+                "user": vals["user"],
+                "password": vals["password"],
             },
             "tables": []
         }
 
         # Add database_name if provided
-        if self.database_var.get().strip():
-            config["connector"]["database_name"] = self.database_var.get().strip()
+        if vals["database"]:
+            config["connector"]["database_name"] = vals["database"]
 
         config_path = self.get_config_path()
 
         try:
             with open(config_path, "w") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    config, f, Dumper=_YamlDumper,
+                    default_flow_style=False, sort_keys=False,
+                )
+
+            # Sidecar JSON cache: load_config prefers it over the YAML
+            # because JSON parses far faster. Best effort only.
+            from .config import json_cache_path
+            try:
+                with open(json_cache_path(config_path), "w") as f:
+                    json.dump(config, f)
+            except OSError:
+                pass
 
             messagebox.showinfo(
                 "Configuration Saved",
@@ -279,7 +345,7 @@ def main():
     try:
         root.tk.call("source", "azure.tcl")
         root.tk.call("set_theme", "light")
-    except:
+    except tk.TclError:
         pass
 
     # Use native Windows style
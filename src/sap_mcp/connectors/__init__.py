@@ -21,7 +21,7 @@ def create_connector(config: Config) -> BaseConnector:
     connector_type = config.connector_type
 
     if connector_type == "hana":
-        hana_config = config.get_hana_config()
+        hana_config = config.hana_config
         return HanaConnector(
             host=hana_config.host,
             port=hana_config.port,
@@ -32,7 +32,7 @@ def create_connector(config: Config) -> BaseConnector:
             ssl_validate=hana_config.sslValidateCertificate,
         )
     elif connector_type == "odbc":
-        odbc_config = config.get_odbc_config()
+        odbc_config = config.odbc_config
         return OdbcConnector(connection_string=odbc_config.connection_string)
     else:
         raise ValueError(f"Unknown connector type: {connector_type}")
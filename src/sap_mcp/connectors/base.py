@@ -1,7 +1,7 @@
 """Abstract base class for database connectors."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterator, Optional
 
 
 class BaseConnector(ABC):
@@ -66,6 +66,20 @@ class BaseConnector(ABC):
         """
         pass
 
+    def execute_query_iter(self, sql: str) -> Iterator[dict[str, Any]]:
+        """Execute a SQL SELECT query, yielding rows one at a time.
+
+        Connectors override this to fetch in chunks so peak memory is
+        bounded by one chunk rather than the full result set.
+
+        Args:
+            sql: SQL SELECT statement
+
+        Yields:
+            Row dictionaries
+        """
+        yield from self.execute_query(sql)
+
     @abstractmethod
     def test_connection(self) -> bool:
         """Test if the database connection works.
@@ -84,6 +98,10 @@ class BaseConnector(ABC):
         Returns:
             Quoted identifier
         """
-        # Default implementation uses double quotes (SQL standard)
+        # Default implementation uses double quotes (SQL standard).
+        # Identifiers almost never contain a quote, so skip the
+        # replace() allocation in the common case.
+        if '"' not in identifier:
+            return f'"{identifier}"'
         escaped = identifier.replace('"', '""')
         return f'"{escaped}"'
@@ -1,12 +1,45 @@
 """SAP HANA database connector using hdbcli."""
 
-from typing import Any
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator
 from .base import BaseConnector
 
 
 class HanaConnector(BaseConnector):
     """SAP HANA database connector using hdbcli."""
 
+    # Rows fetched per round-trip when streaming query results
+    FETCH_SIZE = 10_000
+
+    # Seconds to wait for a pooled connection before giving up; a bound
+    # here turns a leaked/stuck connection into an error instead of a
+    # permanently wedged server
+    ACQUIRE_TIMEOUT = 30.0
+
+    # Base metadata SQL, built once at class creation; methods append
+    # their conditional clauses to these (cached per variant)
+    _SQL_TABLES = """
+        SELECT
+            SCHEMA_NAME as "Schema",
+            TABLE_NAME as "Table",
+            COMMENTS as "Description"
+        FROM SYS.TABLES
+        WHERE 1=1
+    """
+
+    _SQL_COLUMNS = """
+        SELECT
+            SCHEMA_NAME as "Schema",
+            TABLE_NAME as "Table",
+            COLUMN_NAME as "Column",
+            DATA_TYPE_NAME as "DataType",
+            COMMENTS as "Description"
+        FROM SYS.TABLE_COLUMNS
+        WHERE TABLE_NAME IN ({placeholders})
+    """
+
     def __init__(
         self,
         host: str,
@@ -16,6 +49,7 @@ class HanaConnector(BaseConnector):
         database_name: str | None = None,
         encrypt: bool = False,
         ssl_validate: bool = True,
+        pool_size: int = 4,
     ):
         """Initialize HANA connector.
 
@@ -27,6 +61,7 @@ class HanaConnector(BaseConnector):
             database_name: Tenant database name (for multi-tenant HANA)
             encrypt: Enable SSL encryption
             ssl_validate: Validate SSL certificate
+            pool_size: Maximum number of pooled connections
         """
         self.host = host
         self.port = port
@@ -35,7 +70,18 @@ class HanaConnector(BaseConnector):
         self.database_name = database_name
         self.encrypt = encrypt
         self.ssl_validate = ssl_validate
-        self._connection = None
+        self._pool: queue.Queue = queue.Queue(maxsize=pool_size)
+        self._pool_size = pool_size
+        self._pool_lock = threading.Lock()
+        self._created = 0
+        # Built SQL text per clause combination; identical strings give
+        # HANA's statement/plan cache identical keys across calls
+        self._stmt_cache: dict[Any, str] = {}
+        # Dedicated connection/cursor reused across metadata lookups,
+        # saving a cursor-creation round-trip per call
+        self._meta_conn: Any = None
+        self._meta_cursor: Any = None
+        self._cursor_lock = threading.Lock()
 
     def connect(self) -> Any:
         """Create and return a HANA database connection."""
@@ -52,6 +98,9 @@ class HanaConnector(BaseConnector):
             "port": self.port,
             "user": self.user,
             "password": self.password,
+            # Fail fast on an unreachable host instead of hanging for
+            # the OS-default TCP timeout (values in milliseconds)
+            "connectTimeout": 5000,
         }
 
         # Add database name for multi-tenant connections
@@ -63,14 +112,80 @@ class HanaConnector(BaseConnector):
             connect_params["encrypt"] = True
             connect_params["sslValidateCertificate"] = self.ssl_validate
 
-        self._connection = dbapi.connect(**connect_params)
-        return self._connection
+        return dbapi.connect(**connect_params)
 
-    def _get_connection(self) -> Any:
-        """Get existing connection or create new one."""
-        if self._connection is None:
-            self.connect()
-        return self._connection
+    @contextmanager
+    def _acquire(self):
+        """Borrow a connection from the pool, creating one if underfilled.
+
+        Concurrent tool calls each get their own connection (up to
+        pool_size) instead of serializing on a single shared one.
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                underfilled = self._created < self._pool_size
+                if underfilled:
+                    self._created += 1
+            if underfilled:
+                try:
+                    conn = self.connect()
+                except Exception:
+                    with self._pool_lock:
+                        self._created -= 1
+                    raise
+            else:
+                # Pool exhausted; wait for a connection to be returned
+                try:
+                    conn = self._pool.get(timeout=self.ACQUIRE_TIMEOUT)
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"Timed out after {self.ACQUIRE_TIMEOUT}s waiting for a "
+                        f"pooled connection ({self._pool_size} in use)"
+                    )
+        # BaseException, not Exception: a caller abandoning a partially
+        # consumed execute_query_iter throws GeneratorExit here, and that
+        # exit path must also return-or-drop the connection or the pool
+        # slot leaks permanently
+        try:
+            yield conn
+        except BaseException:
+            # Connection state is unknown after an error (or the query
+            # was abandoned mid-stream with results pending); drop it
+            with self._pool_lock:
+                self._created -= 1
+            try:
+                conn.close()
+            except Exception:
+                pass
+            raise
+        else:
+            self._pool.put(conn)
+
+    @contextmanager
+    def _metadata_cursor(self):
+        """Reusable cursor for metadata queries, serialized by a lock.
+
+        Keeping one cursor alive avoids the per-call cursor-creation
+        round-trip that get_tables/get_columns otherwise pay.
+        """
+        with self._cursor_lock:
+            if self._meta_cursor is None:
+                self._meta_conn = self.connect()
+                self._meta_cursor = self._meta_conn.cursor()
+            try:
+                yield self._meta_cursor
+            except Exception:
+                # Cursor/connection state is unknown after an error;
+                # drop both so the next call reconnects
+                try:
+                    self._meta_conn.close()
+                except Exception:
+                    pass
+                self._meta_conn = None
+                self._meta_cursor = None
+                raise
 
     def get_tables(
         self,
@@ -83,45 +198,40 @@ class HanaConnector(BaseConnector):
 
         Uses HANA's TABLES system view to retrieve table metadata.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # Build query for HANA system tables
-        sql = """
-            SELECT
-                SCHEMA_NAME as "Schema",
-                TABLE_NAME as "Table",
-                COMMENTS as "Description"
-            FROM SYS.TABLES
-            WHERE 1=1
-        """
-        params = []
+        # Build query for HANA system tables, cached per clause combination
+        key = ("tables", bool(schema), bool(search))
+        sql = self._stmt_cache.get(key)
+        if sql is None:
+            sql = self._SQL_TABLES
+            if schema:
+                sql += " AND SCHEMA_NAME = ?"
+            if search:
+                # Case-insensitive search
+                sql += " AND upper(TABLE_NAME) LIKE ?"
+            sql += " ORDER BY SCHEMA_NAME, TABLE_NAME"
+            # Bind LIMIT as a parameter so the SQL text stays stable
+            # (plan-cache friendly) and the value can't inject SQL
+            sql += " LIMIT ?"
+            self._stmt_cache[key] = sql
 
+        params = []
         if schema:
-            sql += " AND SCHEMA_NAME = ?"
             params.append(schema)
-
         if search:
-            # Case-insensitive search
-            sql += " AND upper(TABLE_NAME) LIKE ?"
             params.append(f"%{search.upper()}%")
-
-        sql += " ORDER BY SCHEMA_NAME, TABLE_NAME"
-        
-        # Add LIMIT clause
-        sql += f" LIMIT {limit}"
-
-        cursor.execute(sql, params)
-
-        tables = []
-        for row in cursor:
-            tables.append({
-                "Schema": row[0],
-                "Table": row[1],
-                "Description": row[2] or "",
-            })
-
-        cursor.close()
+        params.append(int(limit))
+
+        with self._metadata_cursor() as cursor:
+            cursor.execute(sql, params)
+
+            tables = [
+                {
+                    "Schema": row[0],
+                    "Table": row[1],
+                    "Description": row[2] or "",
+                }
+                for row in cursor.fetchall()
+            ]
         return tables
 
     def get_columns(
@@ -134,70 +244,82 @@ class HanaConnector(BaseConnector):
 
         Uses HANA's TABLE_COLUMNS system view.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        sql = """
-            SELECT
-                SCHEMA_NAME as "Schema",
-                TABLE_NAME as "Table",
-                COLUMN_NAME as "Column",
-                DATA_TYPE_NAME as "DataType",
-                COMMENTS as "Description"
-            FROM SYS.TABLE_COLUMNS
-            WHERE TABLE_NAME = ?
-        """
-        params = [table]
+        return self.get_columns_batch([table], schema=schema).get(table, [])
+
+    def get_columns_batch(
+        self,
+        tables: list[str],
+        schema: str | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get columns for several HANA tables in one query.
 
+        A single TABLE_NAME IN (...) query replaces one round-trip per
+        table; rows are bucketed client-side by table name.
+        """
+        if not tables:
+            return {}
+
+        key = ("columns", bool(schema), len(tables))
+        sql = self._stmt_cache.get(key)
+        if sql is None:
+            placeholders = ",".join("?" * len(tables))
+            sql = self._SQL_COLUMNS.format(placeholders=placeholders)
+            if schema:
+                sql += " AND SCHEMA_NAME = ?"
+            sql += " ORDER BY TABLE_NAME, POSITION"
+            self._stmt_cache[key] = sql
+
+        params = list(tables)
         if schema:
-            sql += " AND SCHEMA_NAME = ?"
             params.append(schema)
 
-        sql += " ORDER BY POSITION"
-
-        cursor.execute(sql, params)
-
-        columns = []
-        for row in cursor:
-            columns.append({
-                "Schema": row[0],
-                "Table": row[1],
-                "Column": row[2],
-                "DataType": row[3],
-                "Description": row[4] or "",
-            })
-
-        cursor.close()
+        columns: dict[str, list[dict[str, Any]]] = {t: [] for t in tables}
+        with self._metadata_cursor() as cursor:
+            cursor.execute(sql, params)
+
+            for row in cursor.fetchall():
+                columns[row[1]].append({
+                    "Schema": row[0],
+                    "Table": row[1],
+                    "Column": row[2],
+                    "DataType": row[3],
+                    "Description": row[4] or "",
+                })
         return columns
 
     def execute_query(self, sql: str) -> list[dict[str, Any]]:
         """Execute a SQL SELECT query on HANA."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return list(self.execute_query_iter(sql))
 
-        cursor.execute(sql)
+    def execute_query_iter(self, sql: str) -> Iterator[dict[str, Any]]:
+        """Execute a SQL SELECT query on HANA, yielding rows in chunks.
 
-        # Get column names from cursor description
-        column_names = [desc[0] for desc in cursor.description]
+        Fetches FETCH_SIZE rows at a time so peak memory is bounded by
+        one chunk rather than the whole result set.
+        """
+        with self._acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql)
 
-        rows = []
-        for row in cursor:
-            row_dict = {}
-            for i, value in enumerate(row):
-                row_dict[column_names[i]] = value
-            rows.append(row_dict)
+            # Read cursor.description exactly once; a tuple is the
+            # cheapest structure for zip() to iterate per row
+            column_names = tuple(desc[0] for desc in cursor.description)
 
-        cursor.close()
-        return rows
+            while True:
+                chunk = cursor.fetchmany(self.FETCH_SIZE)
+                if not chunk:
+                    break
+                # dict(zip(...)) builds each row in C
+                yield from (dict(zip(column_names, row)) for row in chunk)
+
+            cursor.close()
 
     def test_connection(self) -> bool:
         """Test HANA connection by querying DUMMY table."""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1 FROM DUMMY")
-            cursor.fetchone()
-            cursor.close()
+            with self._metadata_cursor() as cursor:
+                cursor.execute("SELECT 1 FROM DUMMY")
+                cursor.fetchone()
             return True
         except Exception as e:
             # Store the error for later retrieval
@@ -209,7 +331,23 @@ class HanaConnector(BaseConnector):
         return getattr(self, '_last_error', 'Unknown error')
 
     def close(self):
-        """Close the database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close all pooled database connections."""
+        with self._cursor_lock:
+            if self._meta_conn is not None:
+                try:
+                    self._meta_conn.close()
+                except Exception:
+                    pass
+                self._meta_conn = None
+                self._meta_cursor = None
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            with self._pool_lock:
+                self._created -= 1
+            try:
+                conn.close()
+            except Exception:
+                pass
@@ -1,12 +1,15 @@
 """Generic ODBC database connector using pyodbc."""
 
-from typing import Any
+from typing import Any, Iterator
 from .base import BaseConnector
 
 
 class OdbcConnector(BaseConnector):
     """Generic ODBC database connector using pyodbc."""
 
+    # Rows fetched per round-trip when streaming query results
+    FETCH_SIZE = 10_000
+
     def __init__(self, connection_string: str):
         """Initialize ODBC connector.
 
@@ -96,23 +99,31 @@ class OdbcConnector(BaseConnector):
 
     def execute_query(self, sql: str) -> list[dict[str, Any]]:
         """Execute a SQL SELECT query via ODBC."""
+        return list(self.execute_query_iter(sql))
+
+    def execute_query_iter(self, sql: str) -> Iterator[dict[str, Any]]:
+        """Execute a SQL SELECT query via ODBC, yielding rows in chunks.
+
+        Fetches FETCH_SIZE rows at a time so peak memory is bounded by
+        one chunk rather than the whole result set.
+        """
         conn = self._get_connection()
         cursor = conn.cursor()
 
         cursor.execute(sql)
 
-        # Get column names from cursor description
-        column_names = [desc[0] for desc in cursor.description]
+        # Read cursor.description exactly once; a tuple is the
+        # cheapest structure for zip() to iterate per row
+        column_names = tuple(desc[0] for desc in cursor.description)
 
-        rows = []
-        for row in cursor:
-            row_dict = {}
-            for i, value in enumerate(row):
-                row_dict[column_names[i]] = value
-            rows.append(row_dict)
+        while True:
+            chunk = cursor.fetchmany(self.FETCH_SIZE)
+            if not chunk:
+                break
+            # dict(zip(...)) builds each row in C
+            yield from (dict(zip(column_names, row)) for row in chunk)
 
         cursor.close()
-        return rows
 
     def test_connection(self) -> bool:
         """Test ODBC connection with a simple query."""
@@ -2,7 +2,54 @@
 
 import csv
 import io
-from typing import Any, Sequence
+import queue
+import re
+import threading
+from itertools import chain
+from typing import Any, Iterable, Iterator, Sequence
+
+# Cells containing any of these need the csv module's quoting machinery
+_UNSAFE_RE = re.compile(r'[,"\n\r]')
+
+
+class _ListWriter:
+    """Minimal file-like that collects writes into a list.
+
+    Appending string chunks and joining once at the end avoids
+    StringIO's buffer resizes and the final getvalue() copy, which
+    dominate for the many small CSVs the metadata tools emit.
+    """
+
+    __slots__ = ("_buf",)
+
+    def __init__(self):
+        self._buf: list[str] = []
+
+    def write(self, s: str) -> None:
+        self._buf.append(s)
+
+    def getvalue(self) -> str:
+        return "".join(self._buf)
+
+
+_TLS = threading.local()
+
+
+def _acquire_writer():
+    """Per-thread reusable (buffer, csv.writer) pair.
+
+    csv.writer construction parses the dialect every time; for a server
+    emitting thousands of small CSVs that setup dominates. The writer
+    holds a reference to its buffer, so the pair is cached together and
+    the buffer is simply cleared between uses.
+    """
+    pair = getattr(_TLS, "pair", None)
+    if pair is None:
+        buf = _ListWriter()
+        pair = (buf, csv.writer(buf, quoting=csv.QUOTE_MINIMAL))
+        _TLS.pair = pair
+    pair[0]._buf.clear()
+    return pair
 
 
 def to_csv(rows: Sequence[dict[str, Any]], columns: list[str] | None = None) -> str:
@@ -19,22 +66,103 @@ def to_csv(rows: Sequence[dict[str, Any]], columns: list[str] | None = None) ->
     if not rows:
         return ""
 
-    output = io.StringIO()
-
     # Determine columns
     if columns is None:
         columns = list(rows[0].keys())
 
-    writer = csv.DictWriter(
-        output,
-        fieldnames=columns,
-        quoting=csv.QUOTE_ALL,
-        extrasaction="ignore",
-    )
-    writer.writeheader()
+    # Catalog metadata is almost entirely plain identifiers that need
+    # no quoting; when every cell is a safe string (or None), plain
+    # join is 2-4x cheaper than the csv module's escape machinery.
+    cell_rows = [list(map(row.get, columns)) for row in rows]
+    search = _UNSAFE_RE.search
+    safe = not any(map(search, columns))
+    if safe:
+        for cells in cell_rows:
+            for cell in cells:
+                if cell is not None and (type(cell) is not str or search(cell)):
+                    safe = False
+                    break
+            if not safe:
+                break
 
-    for row in rows:
-        writer.writerow(row)
+    if safe:
+        lines = [",".join(columns)]
+        lines.extend(
+            ",".join(cell if cell is not None else "" for cell in cells)
+            for cells in cell_rows
+        )
+        # Same row terminator the csv module would emit
+        return "\r\n".join(lines) + "\r\n"
+
+    # csv.writer over projected value lists: DictWriter re-hashes every
+    # fieldname per row and scans for extra keys; this does neither
+    output, writer = _acquire_writer()
+    writer.writerow(columns)
+    writer.writerows(cell_rows)
+
+    return output.getvalue()
+
+
+def to_csv_bytes(rows: Sequence[dict[str, Any]], columns: list[str] | None = None) -> bytes:
+    """Convert a list of dictionaries to UTF-8 encoded CSV bytes.
+
+    Writes through a TextIOWrapper into BytesIO, so the encode happens
+    while formatting instead of as a separate pass over the finished
+    string. The MCP tool signatures currently require str, so this is
+    for callers that can ship bytes directly (file export, a future
+    bytes-capable transport); to_csv remains the default path.
+
+    Args:
+        rows: List of row dictionaries
+        columns: Optional list of column names to include (in order).
+                 If None, uses keys from first row.
+
+    Returns:
+        UTF-8 encoded CSV with headers
+    """
+    if not rows:
+        return b""
+
+    if columns is None:
+        columns = list(rows[0].keys())
+
+    buf = io.BytesIO()
+    wrapper = io.TextIOWrapper(buf, encoding="utf-8", newline="", write_through=True)
+    writer = csv.writer(wrapper, quoting=csv.QUOTE_MINIMAL)
+    writer.writerow(columns)
+    writer.writerows(map(row.get, columns) for row in rows)
+    wrapper.flush()
+
+    return buf.getvalue()
+
+
+def iter_to_csv(rows: Iterable[dict[str, Any]], columns: list[str] | None = None) -> str:
+    """Convert an iterator of row dictionaries to CSV string.
+
+    Unlike to_csv, this never materializes the row list: rows flow from
+    the iterator straight into the writer, so it pairs with the
+    connectors' execute_query_iter to keep peak memory at one fetch
+    chunk plus the output string.
+
+    Args:
+        rows: Iterable of row dictionaries
+        columns: Optional list of column names to include (in order).
+                 If None, uses keys from the first row.
+
+    Returns:
+        CSV formatted string with headers, or "" if the iterator is empty
+    """
+    it = iter(rows)
+    first = next(it, None)
+    if first is None:
+        return ""
+
+    if columns is None:
+        columns = list(first.keys())
+
+    output, writer = _acquire_writer()
+    writer.writerow(columns)
+    writer.writerows(map(row.get, columns) for row in chain((first,), it))
 
     return output.getvalue()
 
@@ -50,42 +178,125 @@ def cursor_to_rows(cursor, column_names: list[str] | None = None) -> list[dict[s
     Returns:
         List of row dictionaries
     """
+    it = iter(cursor)
+    first = next(it, None)
+    if first is None:
+        return []
+
+    # Drivers configured with a dict row factory already return what we
+    # want; pass those rows through instead of re-dicting them
+    if isinstance(first, dict):
+        return [first, *it]
+
     if column_names is None:
         column_names = [desc[0] for desc in cursor.description]
 
-    rows = []
-    for row in cursor:
-        row_dict = {}
-        for i, value in enumerate(row):
-            row_dict[column_names[i]] = value
-        rows.append(row_dict)
+    # dict(zip(...)) builds each row in C instead of a per-column loop
+    return [dict(zip(column_names, row)) for row in chain((first,), it)]
+
 
-    return rows
+def _prefetch_batches(cursor, batch_size: int) -> Iterator[list]:
+    """Yield fetchmany batches, fetching the next one in the background.
 
+    CSV encoding is CPU-bound Python while fetchmany is network-bound
+    (the HANA driver releases the GIL during I/O), so a producer thread
+    fetching batch N+1 while the caller encodes batch N overlaps the
+    two. The bounded queue backpressures the producer to at most two
+    batches in flight.
 
-def cursor_to_csv(cursor, column_mapping: list[tuple[str, str]] | None = None) -> str:
+    If the consumer abandons the generator (an encoding error, an early
+    return), closing it sets the cancelled flag; the producer polls it
+    on every put, so it exits within a timeout instead of blocking on
+    the full queue forever while holding the cursor.
+    """
+    batches: queue.Queue = queue.Queue(maxsize=2)
+    cancelled = threading.Event()
+
+    def put(item) -> bool:
+        while not cancelled.is_set():
+            try:
+                batches.put(item, timeout=1.0)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            while not cancelled.is_set():
+                batch = cursor.fetchmany(batch_size)
+                if not put(batch) or not batch:
+                    return
+        except BaseException as exc:
+            put(exc)
+
+    threading.Thread(target=produce, daemon=True).start()
+
+    try:
+        while True:
+            item = batches.get()
+            if isinstance(item, BaseException):
+                raise item
+            if not item:
+                return
+            yield item
+    finally:
+        cancelled.set()
+
+
+def cursor_to_csv(
+    cursor,
+    column_mapping: list[tuple[str, str]] | None = None,
+    batch_size: int = 1000,
+) -> str:
     """Convert a database cursor directly to CSV string.
 
+    Rows are streamed from the cursor in batches straight into
+    csv.writer, so no intermediate per-row dicts are built and peak
+    memory stays bounded by one batch.
+
     Args:
         cursor: Database cursor with results
         column_mapping: Optional list of (db_column, display_name) tuples.
                         If None, uses cursor column names as-is.
+        batch_size: Rows fetched from the cursor per round-trip
 
     Returns:
-        CSV formatted string with headers
+        CSV formatted string with headers, or "" for an empty result
     """
+    batches = _prefetch_batches(cursor, batch_size)
+    first = next(batches, None)
+    if first is None:
+        return ""
+
+    output, writer = _acquire_writer()
+
     if column_mapping:
-        db_columns = [m[0] for m in column_mapping]
-        display_names = [m[1] for m in column_mapping]
-        rows = cursor_to_rows(cursor, db_columns)
-        # Rename columns for display
-        renamed_rows = []
-        for row in rows:
-            renamed = {}
-            for db_col, display_name in column_mapping:
-                renamed[display_name] = row.get(db_col)
-            renamed_rows.append(renamed)
-        return to_csv(renamed_rows, display_names)
-    else:
-        rows = cursor_to_rows(cursor)
-        return to_csv(rows)
+        # Project cells by position straight from the driver tuples --
+        # one pass, no intermediate dicts for the rename. A db column
+        # missing from the result keeps producing empty cells.
+        desc_index = {d[0]: i for i, d in enumerate(cursor.description)}
+        indexes = [desc_index.get(db_col) for db_col, _ in column_mapping]
+        writer.writerow([name for _, name in column_mapping])
+        for batch in chain((first,), batches):
+            writer.writerows(
+                [row[i] if i is not None else None for i in indexes]
+                for row in batch
+            )
+        return output.getvalue()
+
+    writer.writerow([desc[0] for desc in cursor.description])
+    for batch in chain((first,), batches):
+        writer.writerows(batch)
+
+    return output.getvalue()
+
+
+try:
+    # Optional compiled accelerator: a csv_utils_fast extension module
+    # (e.g. Cython-built) dropped into the package overrides the
+    # pure-Python renderer. The project's build stays pure Python, so
+    # this is absent unless someone ships the extension themselves.
+    from .csv_utils_fast import to_csv
+except ImportError:
+    pass
@@ -1,6 +1,8 @@
 """SAP MCP Server - Main server module."""
 
 import argparse
+import functools
+import inspect
 import logging
 import sys
 from typing import Optional
@@ -33,6 +35,14 @@ class SapMcpServer:
         self.connector = connector
         self.mcp = FastMCP(config.server.name)
 
+        # Signature inspection is slow; resolve the accepted run()
+        # parameters once (they vary across FastMCP versions)
+        self._run_params = frozenset(inspect.signature(self.mcp.run).parameters)
+
+        # Fully-configured run callables, built on first use per
+        # (transport, host, port) so supervisor restarts skip the setup
+        self._http_runners: dict[tuple, functools.partial] = {}
+
         # Register all tools
         register_all_tools(self.mcp, connector, config.server.prefix)
 
@@ -46,29 +56,33 @@ class SapMcpServer:
         """
         if transport == "stdio":
             self.mcp.run(transport=transport)
-        else:
-            # For HTTP-based transports (sse, streamable-http)
-            # Inspect signature to support different versions of FastMCP
-            import inspect
-            sig = inspect.signature(self.mcp.run)
+            return
+
+        runner = self._http_runners.get((transport, host, port))
+        if runner is None:
+            # For HTTP-based transports (sse, streamable-http), pass
+            # only the parameters this FastMCP version accepts
             kwargs = {"transport": transport}
-            
-            if "host" in sig.parameters:
+
+            if "host" in self._run_params:
                 kwargs["host"] = host
-            if "port" in sig.parameters:
+            if "port" in self._run_params:
                 kwargs["port"] = port
-                
-            if "host" not in sig.parameters and (host != "0.0.0.0" or port != 8080):
-                 logger.warning("FastMCP.run() does not accept host/port arguments. Using defaults.")
-            
+
+            if "host" not in self._run_params and (host != "0.0.0.0" or port != 8080):
+                logger.warning("FastMCP.run() does not accept host/port arguments. Using defaults.")
+
             # CRITICAL FIX for ngrok: Allow specific settings to bypass host validation if possible
-            # or try to catch the ValueError. 
+            # or try to catch the ValueError.
             try:
-                self.mcp.settings.allowed_hosts = ["*"] 
+                self.mcp.settings.allowed_hosts = ["*"]
             except (AttributeError, ValueError):
                 logger.warning("Could not set allowed_hosts on FastMCP settings. Host validation might fail for ngrok.")
-            
-            self.mcp.run(**kwargs)
+
+            runner = functools.partial(self.mcp.run, **kwargs)
+            self._http_runners[(transport, host, port)] = runner
+
+        runner()
 
 
 def create_server(config_path: str) -> SapMcpServer:
@@ -1,17 +1,19 @@
 """MCP Tools for SAP database access."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from .get_tables import register_get_tables_tool
 from .get_columns import register_get_columns_tool
 from .run_query import register_run_query_tool
-from ..connectors.base import BaseConnector
 
-try:
+if TYPE_CHECKING:
     from mcp.server.fastmcp import FastMCP
-except ImportError:
-    FastMCP = None
+    from ..connectors.base import BaseConnector
 
 
-def register_all_tools(mcp: "FastMCP", connector: BaseConnector, prefix: str) -> None:
+def register_all_tools(mcp: FastMCP, connector: BaseConnector, prefix: str) -> None:
     """Register all MCP tools with the server.
 
     Args:
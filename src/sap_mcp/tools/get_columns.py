@@ -1,16 +1,21 @@
 """MCP Tool: Get list of columns for a table."""
 
-from typing import Optional
-from ..connectors.base import BaseConnector
-from ..csv_utils import to_csv
+from __future__ import annotations
 
-try:
+import time
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
     from mcp.server.fastmcp import FastMCP
-except ImportError:
-    FastMCP = None
+    from ..connectors.base import BaseConnector
+
+# How long cached column CSV stays fresh. Schema changes are rare (DDL
+# is blocked in run_query), but a short TTL keeps external changes from
+# going unnoticed for long.
+CACHE_TTL_SECONDS = 300.0
 
 
-def register_get_columns_tool(mcp: "FastMCP", connector: BaseConnector, prefix: str) -> None:
+def register_get_columns_tool(mcp: FastMCP, connector: BaseConnector, prefix: str) -> None:
     """Register the get_columns tool with the MCP server.
 
     Args:
@@ -18,6 +23,11 @@ def register_get_columns_tool(mcp: "FastMCP", connector: BaseConnector, prefix:
         connector: Database connector
         prefix: Tool name prefix
     """
+    from ..csv_utils import to_csv
+
+    # LLM agents ask for the same tables across turns; memoize the CSV
+    # per (table, catalog, schema) so repeat calls skip the database
+    cache: dict[tuple, tuple[float, str]] = {}
 
     @mcp.tool(name=f"{prefix}_get_columns")
     def get_columns(
@@ -41,21 +51,39 @@ def register_get_columns_tool(mcp: "FastMCP", connector: BaseConnector, prefix:
         if not table:
             return "ERROR: table parameter is required"
 
+        key = (table, catalog, schema)
+        cached = cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < CACHE_TTL_SECONDS:
+            return cached[1]
+
         try:
             columns = connector.get_columns(table=table, catalog=catalog, schema=schema)
 
             if not columns:
                 return f"No columns found for table: {table}"
 
-            # Determine which columns to include based on data
+            # Determine which columns to include based on data. ODBC
+            # drivers fill Catalog/Schema per row, so no prefix of the
+            # rows is guaranteed representative; one fused pass over all
+            # rows with early exit once both flags are set decides the
+            # headers.
+            has_catalog = has_schema = False
+            for c in columns:
+                has_catalog = has_catalog or bool(c.get("Catalog"))
+                has_schema = has_schema or bool(c.get("Schema"))
+                if has_catalog and has_schema:
+                    break
+
             output_columns = []
-            if any(c.get("Catalog") for c in columns):
+            if has_catalog:
                 output_columns.append("Catalog")
-            if any(c.get("Schema") for c in columns):
+            if has_schema:
                 output_columns.append("Schema")
             output_columns.extend(["Table", "Column", "DataType", "Description"])
 
-            return to_csv(columns, output_columns)
+            result = to_csv(columns, output_columns)
+            cache[key] = (time.monotonic(), result)
+            return result
 
         except Exception as e:
             return f"ERROR: {str(e)}"
@@ -1,16 +1,15 @@
 """MCP Tool: Get list of database tables."""
 
-from typing import Optional
-from ..connectors.base import BaseConnector
-from ..csv_utils import to_csv
+from __future__ import annotations
 
-try:
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
     from mcp.server.fastmcp import FastMCP
-except ImportError:
-    FastMCP = None
+    from ..connectors.base import BaseConnector
 
 
-def register_get_tables_tool(mcp: "FastMCP", connector: BaseConnector, prefix: str) -> None:
+def register_get_tables_tool(mcp: FastMCP, connector: BaseConnector, prefix: str) -> None:
     """Register the get_tables tool with the MCP server.
 
     Args:
@@ -18,6 +17,7 @@ def register_get_tables_tool(mcp: "FastMCP", connector: BaseConnector, prefix: s
         connector: Database connector
         prefix: Tool name prefix
     """
+    from ..csv_utils import to_csv
 
     @mcp.tool(name=f"{prefix}_get_tables")
     def get_tables(
@@ -48,11 +48,22 @@ def register_get_tables_tool(mcp: "FastMCP", connector: BaseConnector, prefix: s
             if not tables:
                 return "No tables found."
 
-            # Determine which columns to include based on data
+            # Determine which columns to include based on data. ODBC
+            # drivers fill Catalog/Schema per row, so no prefix of the
+            # rows is guaranteed representative; one fused pass over all
+            # rows (capped at `limit` anyway) with early exit once both
+            # flags are set decides the headers.
+            has_catalog = has_schema = False
+            for t in tables:
+                has_catalog = has_catalog or bool(t.get("Catalog"))
+                has_schema = has_schema or bool(t.get("Schema"))
+                if has_catalog and has_schema:
+                    break
+
             columns = []
-            if any(t.get("Catalog") for t in tables):
+            if has_catalog:
                 columns.append("Catalog")
-            if any(t.get("Schema") for t in tables):
+            if has_schema:
                 columns.append("Schema")
             columns.extend(["Table", "Description"])
 
@@ -1,15 +1,26 @@
 """MCP Tool: Execute SQL SELECT query."""
 
-from ..connectors.base import BaseConnector
-from ..csv_utils import to_csv
+from __future__ import annotations
 
-try:
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
     from mcp.server.fastmcp import FastMCP
-except ImportError:
-    FastMCP = None
+    from ..connectors.base import BaseConnector
+
+# One pass over the SQL instead of one substring scan per keyword; the
+# word boundaries also stop identifiers like CREATED_AT from matching
+_DANGER_RE = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|TRUNCATE)\b", re.IGNORECASE
+)
 
+# Prefix/containment checks that used to need a full strip().upper()
+# copy of the (potentially multi-KB) SQL text
+_SELECT_RE = re.compile(r"\s*SELECT\b", re.IGNORECASE)
+_LIMIT_RE = re.compile(r"\b(?:LIMIT|TOP)\b", re.IGNORECASE)
 
-def register_run_query_tool(mcp: "FastMCP", connector: BaseConnector, prefix: str) -> None:
+def register_run_query_tool(mcp: FastMCP, connector: BaseConnector, prefix: str) -> None:
     """Register the run_query tool with the MCP server.
 
     Args:
@@ -17,6 +28,7 @@ def register_run_query_tool(mcp: "FastMCP", connector: BaseConnector, prefix: st
         connector: Database connector
         prefix: Tool name prefix
     """
+    from ..csv_utils import iter_to_csv
 
     @mcp.tool(name=f"{prefix}_run_query")
     def run_query(sql: str) -> str:
@@ -41,29 +53,27 @@ def register_run_query_tool(mcp: "FastMCP", connector: BaseConnector, prefix: st
             return "ERROR: sql parameter is required"
 
         # Basic safety check - only allow SELECT statements
-        sql_upper = sql.strip().upper()
-        if not sql_upper.startswith("SELECT"):
+        if not _SELECT_RE.match(sql):
             return "ERROR: Only SELECT statements are allowed"
 
         # Block dangerous keywords
-        dangerous_keywords = ["INSERT", "UPDATE", "DELETE", "DROP", "CREATE", "ALTER", "TRUNCATE"]
-        for keyword in dangerous_keywords:
-            if keyword in sql_upper:
-                return f"ERROR: {keyword} statements are not allowed"
+        match = _DANGER_RE.search(sql)
+        if match:
+            return f"ERROR: {match.group(1).upper()} statements are not allowed"
 
         try:
             # SAFETY: Enforce a limit if not provided to prevent "compaction failed" on client
             limit_applied = False
-            if "LIMIT" not in sql_upper and "TOP" not in sql_upper:
+            if not _LIMIT_RE.search(sql):
                 sql += " LIMIT 50"
                 limit_applied = True
 
-            rows = connector.execute_query(sql)
+            # Stream rows from the connector straight into the CSV
+            # writer instead of materializing the full result list
+            result_csv = iter_to_csv(connector.execute_query_iter(sql))
 
-            if not rows:
+            if not result_csv:
                 return "Query returned no results."
-
-            result_csv = to_csv(rows)
             
             if limit_applied:
                  return f"Note: Query result limited to 50 rows for performance. Use explicit LIMIT to change this.\n\n{result_csv}"
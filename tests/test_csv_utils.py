@@ -1,7 +1,7 @@
 """Tests for CSV utilities."""
 
 import pytest
-from sap_mcp.csv_utils import to_csv
+from sap_mcp.csv_utils import to_csv, to_csv_bytes
 
 
 def test_to_csv_basic():
@@ -13,12 +13,12 @@ def test_to_csv_basic():
 
     result = to_csv(rows)
 
-    lines = result.strip().split("\n")
+    lines = result.strip().splitlines()
     assert len(lines) == 3  # header + 2 rows
-    assert '"name"' in lines[0]
-    assert '"age"' in lines[0]
-    assert '"Alice"' in lines[1]
-    assert '"Bob"' in lines[2]
+    # Plain cells are not quoted with minimal quoting
+    assert lines[0] == "name,age"
+    assert lines[1] == "Alice,30"
+    assert lines[2] == "Bob,25"
 
 
 def test_to_csv_with_column_order():
@@ -29,9 +29,9 @@ def test_to_csv_with_column_order():
 
     result = to_csv(rows, columns=["a", "b", "c"])
 
-    lines = result.strip().split("\n")
+    lines = result.strip().splitlines()
     # Check column order in header
-    assert lines[0] == '"a","b","c"'
+    assert lines[0] == "a,b,c"
 
 
 def test_to_csv_empty():
@@ -40,6 +40,17 @@ def test_to_csv_empty():
     assert result == ""
 
 
+def test_to_csv_bytes_matches_str():
+    """Test the bytes variant matches the str output encoded as UTF-8."""
+    rows = [
+        {"name": "Alice", "age": "30"},
+        {"name": "Smith, John", "age": "25"},
+    ]
+
+    assert to_csv_bytes(rows) == to_csv(rows).encode("utf-8")
+    assert to_csv_bytes([]) == b""
+
+
 def test_to_csv_with_quotes():
     """Test CSV with quoted content."""
     rows = [